@@ -19,7 +19,8 @@ from __future__ import annotations
 
 import re
 from collections import UserDict
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from eodag.utils.exceptions import NotAvailableError
 from eodag.utils.repr import dict_to_html_table
@@ -30,6 +31,63 @@ if TYPE_CHECKING:
     from eodag.utils import Unpack
 
 
+# regex metacharacters which prevent an asset filter from being handled as a literal
+_REGEX_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+@lru_cache(maxsize=128)
+def _compiled_asset_filter(asset_filter: str) -> Tuple[re.Pattern[str], str, bool]:
+    """Cached ``re.compile`` of an asset filter, with its literal prefix
+
+    The literal prefix is the part of the filter that any fully-matching key must start
+    with, and is used to cheaply discard non-matching keys before running the regex.
+
+    >>> _compiled_asset_filter("foo")[1:]
+    ('foo', True)
+    >>> _compiled_asset_filter("foo_.*")[1:]
+    ('foo_', False)
+    >>> _compiled_asset_filter("foos?")[1:]
+    ('foo', False)
+    >>> _compiled_asset_filter("foo|bar")[1:]
+    ('', False)
+
+    :param asset_filter: regex with which the asset keys should be matched
+    :type asset_filter: str
+    :returns: compiled regex, literal prefix and whether the whole filter is literal
+    :rtype: tuple
+    """
+    metachar = _REGEX_METACHARS.search(asset_filter)
+    if metachar is None:
+        return re.compile(asset_filter), asset_filter, True
+    if "|" in asset_filter:
+        return re.compile(asset_filter), "", False
+    prefix = asset_filter[: metachar.start()]
+    if metachar.group() in "?*{":
+        # last literal character is quantified and may be missing
+        prefix = prefix[:-1]
+    return re.compile(asset_filter), prefix, False
+
+
+# HTML templates of an asset row in AssetsDict._repr_html_()
+_ASSET_ROW_TMPL = """<td style='text-align: left;'>
+                <details><summary style='color: grey;'>
+                    <span style='color: black'>'{key}'</span>:&ensp;
+                    {{
+                        {roles}
+                        {type}
+                        {title}
+                        ...
+                    }}
+                </summary>
+                    {table}
+                </details>
+                </td></tr>
+                """
+_ASSET_ROLES_TMPL = "'roles': '<span style='color: black'>{}</span>',&ensp;"
+_ASSET_TYPE_TMPL = "'type': '{}',&ensp;"
+_ASSET_TITLE_TMPL = "'title': '<span style='color: black'>{}</span>',&ensp;"
+
+
 class AssetsDict(UserDict):
     """A UserDict object listing assets contained in a
     :class:`~eodag.api.product._product.EOProduct` resulting from a search.
@@ -69,19 +127,23 @@ class AssetsDict(UserDict):
         :rtype: List[Asset]
         """
         if asset_filter:
-            filter_regex = re.compile(asset_filter)
-            assets_keys = list(self.keys())
-            assets_keys = list(filter(filter_regex.fullmatch, assets_keys))
-            filtered_assets = {}
-            if len(assets_keys) > 0:
-                filtered_assets = {a_key: self.get(a_key) for a_key in assets_keys}
-            assets_values = [a for a in filtered_assets.values() if a and "href" in a]
+            filter_regex, prefix, is_literal = _compiled_asset_filter(asset_filter)
+            if is_literal:
+                asset = self.data.get(asset_filter)
+                assets_values = [asset] if asset and "href" in asset else []
+            else:
+                assets_values = [
+                    a
+                    for k, a in self.data.items()
+                    if k.startswith(prefix)
+                    and filter_regex.fullmatch(k)
+                    and "href" in a
+                ]
             if not assets_values:
                 raise NotAvailableError(
                     rf"No asset key matching re.fullmatch(r'{asset_filter}') was found in {self.product}"
                 )
-            else:
-                return assets_values
+            return assets_values
         else:
             return [a for a in self.values() if "href" in a]
 
@@ -94,33 +156,13 @@ class AssetsDict(UserDict):
             if not embeded
             else ""
         )
-        tr_style = "style='background-color: transparent;'" if embeded else ""
-        return (
-            f"<table>{thead}"
-            + "".join(
-                [
-                    f"""<tr {tr_style}><td style='text-align: left;'>
-                <details><summary style='color: grey;'>
-                    <span style='color: black'>'{k}'</span>:&ensp;
-                    {{
-                        {"'roles': '<span style='color: black'>"+str(v['roles'])+"</span>',&ensp;"
-                            if v.get("roles") else ""}
-                        {"'type': '"+str(v['type'])+"',&ensp;"
-                            if v.get("type") else ""}
-                        {"'title': '<span style='color: black'>"+str(v['title'])+"</span>',&ensp;"
-                            if v.get("title") else ""}
-                        ...
-                    }}
-                </summary>
-                    {dict_to_html_table(v, depth=1)}
-                </details>
-                </td></tr>
-                """
-                    for k, v in self.items()
-                ]
-            )
-            + "</table>"
-        )
+        tr_open = "<tr style='background-color: transparent;'>" if embeded else "<tr>"
+        html_parts = [f"<table>{thead}"]
+        for v in self.values():
+            html_parts.append(tr_open)
+            html_parts.append(v._repr_html_row())
+        html_parts.append("</table>")
+        return "".join(html_parts)
 
 
 class Asset(UserDict):
@@ -141,12 +183,29 @@ class Asset(UserDict):
     size: int
     filename: Optional[str]
     rel_path: str
+    # class-level defaults: only assets rendered as HTML carry their own cache
+    _html_cache: Optional[str] = None
+    _table_html_cache: Optional[str] = None
 
     def __init__(self, product: EOProduct, key: str, *args: Any, **kwargs: Any) -> None:
         self.product = product
         self.key = key
         super(Asset, self).__init__(*args, **kwargs)
 
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._clear_html_cache()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._clear_html_cache()
+        super().__delitem__(key)
+
+    def _clear_html_cache(self) -> None:
+        if self._html_cache is not None:
+            self._html_cache = None
+        if self._table_html_cache is not None:
+            self._table_html_cache = None
+
     def as_dict(self) -> Dict[str, Any]:
         """Builds a representation of Asset to enable its serialization
 
@@ -171,9 +230,29 @@ class Asset(UserDict):
             {type(self).__name__}&ensp;-&ensp;{self.key}
             </td></tr></thead>
         """
+        if self._table_html_cache is None:
+            self._table_html_cache = dict_to_html_table(self)
         return f"""<table>{thead}
                 <tr><td style='text-align: left;'>
-                    {dict_to_html_table(self)}
+                    {self._table_html_cache}
                 </details>
                 </td></tr>
             </table>"""
+
+    def _repr_html_row(self) -> str:
+        """HTML row content of this asset in its
+        :class:`~eodag.api.product._assets.AssetsDict` representation, built once and
+        kept until the asset is modified
+        """
+        if self._html_cache is None:
+            roles = self.get("roles")
+            type_ = self.get("type")
+            title = self.get("title")
+            self._html_cache = _ASSET_ROW_TMPL.format(
+                key=self.key,
+                roles=_ASSET_ROLES_TMPL.format(roles) if roles else "",
+                type=_ASSET_TYPE_TMPL.format(type_) if type_ else "",
+                title=_ASSET_TITLE_TMPL.format(title) if title else "",
+                table=dict_to_html_table(self, depth=1),
+            )
+        return self._html_cache
@@ -18,6 +18,9 @@
 from __future__ import annotations
 
 import logging
+import os
+import sys
+from functools import lru_cache
 from operator import attrgetter
 from pathlib import Path
 from typing import (
@@ -30,11 +33,8 @@ from typing import (
     Tuple,
     Type,
     Union,
-    cast,
 )
 
-import pkg_resources
-
 from eodag.config import load_config, merge_configs
 from eodag.plugins.apis.base import Api
 from eodag.plugins.authentication.base import Authentication
@@ -45,6 +45,11 @@ from eodag.plugins.search.base import Search
 from eodag.utils import GENERIC_PRODUCT_TYPE
 from eodag.utils.exceptions import MisconfiguredError, UnsupportedProvider
 
+if sys.version_info >= (3, 10):
+    from importlib.metadata import entry_points
+else:
+    from importlib_metadata import entry_points
+
 if TYPE_CHECKING:
     from eodag.api.product import EOProduct
     from eodag.config import PluginConfig, ProviderConfig
@@ -53,6 +58,30 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("eodag.plugins.manager")
 
+# sort key of providers configurations and plugins by priority
+_PRIO_KEY = attrgetter("priority")
+
+# where providers configuration files are looked for in external plugins packages
+DEFAULT_PLUGIN_PROVIDERS_GLOBS = ("providers.yml", "*/providers.yml")
+
+
+@lru_cache(maxsize=None)
+def _find_plugin_providers_configs(
+    plugin_path: str, patterns: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """Cached search of providers configuration files in an external plugin package
+
+    :param plugin_path: path of the plugin package
+    :type plugin_path: str
+    :param patterns: glob patterns, relative to ``plugin_path``, of the files to find
+    :type patterns: tuple
+    :returns: paths of the providers configuration files found
+    :rtype: tuple
+    """
+    return tuple(
+        str(x) for pattern in patterns for x in sorted(Path(plugin_path).glob(pattern))
+    )
+
 
 class PluginManager:
     """A manager for the plugins.
@@ -75,11 +104,20 @@ class PluginManager:
 
     product_type_to_provider_config_map: Dict[str, List[ProviderConfig]]
 
+    _provider_to_configs: Dict[str, List[ProviderConfig]]
+
+    _provider_to_product_type_providers: Dict[str, List[List[ProviderConfig]]]
+
     skipped_plugins: List[str]
 
     def __init__(self, providers_config: Dict[str, ProviderConfig]) -> None:
         self.skipped_plugins = []
         self.providers_config = providers_config
+        plugin_providers_globs = (
+            (plugin_providers_glob,)
+            if (plugin_providers_glob := os.getenv("EODAG_PLUGIN_PROVIDERS_GLOB"))
+            else DEFAULT_PLUGIN_PROVIDERS_GLOBS
+        )
         # Load all the plugins. This will make all plugin classes of a particular
         # type to be available in the base plugin class's 'plugins' attribute.
         # For example, by importing module 'eodag.plugins.search.resto', the plugin
@@ -90,12 +128,10 @@ class PluginManager:
             # have it discovered as long as they declare an entry point of the type
             # 'eodag.plugins.search' for example in its setup script. See the setup
             # script of eodag for an example of how to do this.
-            for entry_point in pkg_resources.iter_entry_points(
-                "eodag.plugins.{}".format(topic)
-            ):
+            for entry_point in entry_points(group=f"eodag.plugins.{topic}"):
                 try:
                     entry_point.load()
-                except pkg_resources.DistributionNotFound:
+                except ModuleNotFoundError:
                     logger.debug(
                         "%s plugin skipped, eodag[%s] or eodag[all] needed",
                         entry_point.name,
@@ -109,17 +145,20 @@ class PluginManager:
                     logger.warning("Reason:\n%s", tb.format_exc())
                     logger.warning(
                         "Check that the plugin module (%s) is importable",
-                        entry_point.module_name,
+                        entry_point.module,
                     )
-                if entry_point.dist and entry_point.dist.key != "eodag":
+                if (
+                    entry_point.dist
+                    and (dist_name := entry_point.dist.name.lower()) != "eodag"
+                ):
                     # use plugin providers if any
-                    plugin_providers_config_path = [
-                        str(x)
-                        for x in Path(
-                            entry_point.dist.location,
-                            pkg_resources.to_filename(entry_point.dist.key),
-                        ).rglob("providers.yml")
-                    ]
+                    plugin_providers_config_path = _find_plugin_providers_configs(
+                        os.path.join(
+                            str(entry_point.dist.locate_file("")),
+                            dist_name.replace("-", "_"),
+                        ),
+                        plugin_providers_globs,
+                    )
                     if plugin_providers_config_path:
                         plugin_providers_config = load_config(
                             plugin_providers_config_path[0]
@@ -136,24 +175,36 @@ class PluginManager:
             self.providers_config = providers_config
 
         self.build_product_type_to_provider_config_map()
-        self._built_plugins_cache: Dict[Tuple[str, str], Any] = {}
+        self._built_plugins_cache: Dict[Tuple[str, Type[PluginTopic]], Any] = {}
 
     def build_product_type_to_provider_config_map(self) -> None:
         """Build mapping conf between product types and providers"""
         self.product_type_to_provider_config_map = {}
-        for provider in list(self.providers_config):
-            provider_config = self.providers_config[provider]
-            if not hasattr(provider_config, "products") or not provider_config.products:
+        self._provider_to_configs = {}
+        self._provider_to_product_type_providers = {}
+        providers_to_remove: List[str] = []
+        for provider, provider_config in self.providers_config.items():
+            if not getattr(provider_config, "products", None):
                 logger.info(
                     "%s: provider has no product configured and will be skipped",
                     provider,
                 )
-                self.providers_config.pop(provider)
+                providers_to_remove.append(provider)
                 continue
 
             # provider priority set to lowest if not set
             if getattr(provider_config, "priority", None) is None:
-                self.providers_config[provider].priority = provider_config.priority = 0
+                provider_config.priority = 0
+
+            # index configs and product types lists by provider name for set_priority
+            self._provider_to_configs.setdefault(provider_config.name, []).append(
+                provider_config
+            )
+            provider_product_type_providers = (
+                self._provider_to_product_type_providers.setdefault(
+                    provider_config.name, []
+                )
+            )
 
             for product_type in provider_config.products:
                 product_type_providers = (
@@ -162,7 +213,13 @@ class PluginManager:
                     )
                 )
                 product_type_providers.append(provider_config)
-                product_type_providers.sort(key=attrgetter("priority"), reverse=True)
+                provider_product_type_providers.append(product_type_providers)
+
+        for provider in providers_to_remove:
+            self.providers_config.pop(provider, None)
+
+        # sort providers once all of them are mapped
+        self.sort_providers()
 
     def get_search_plugins(
         self, product_type: Optional[str] = None, provider: Optional[str] = None
@@ -188,11 +245,15 @@ class PluginManager:
             if search := getattr(config, "search", None):
                 config.search.products = config.products
                 config.search.priority = config.priority
-                plugin = cast(Search, self._build_plugin(config.name, search, Search))
+                plugin = self._build_plugin(  # type: ignore[assignment]
+                    config.name, search, Search
+                )
             elif api := getattr(config, "api", None):
                 config.api.products = config.products
                 config.api.priority = config.priority
-                plugin = cast(Api, self._build_plugin(config.name, api, Api))
+                plugin = self._build_plugin(  # type: ignore[assignment]
+                    config.name, api, Api
+                )
             else:
                 raise MisconfiguredError(
                     f"No search plugin configureed for {config.name}."
@@ -200,6 +261,8 @@ class PluginManager:
             return plugin
 
         configs: Optional[List[ProviderConfig]]
+        # product type providers lists are kept sorted by priority
+        pre_sorted = True
         if product_type:
             configs = self.product_type_to_provider_config_map.get(product_type)
             if not configs:
@@ -207,13 +270,29 @@ class PluginManager:
                     "UnsupportedProductType: %s, using generic settings", product_type
                 )
                 configs = self.product_type_to_provider_config_map[GENERIC_PRODUCT_TYPE]
+            if provider:
+                configs = [
+                    c
+                    for c in configs
+                    if provider in [getattr(c, "group", None), c.name]
+                ]
+            else:
+                # copy, as the mapped list may be re-sorted while plugins are yielded
+                configs = list(configs)
+        elif provider:
+            # direct lookup by provider name, falling back to providers of the group
+            if provider_config := self.providers_config.get(provider):
+                configs = [provider_config]
+            else:
+                configs = [
+                    c
+                    for c in self.providers_config.values()
+                    if getattr(c, "group", None) == provider
+                ]
+                pre_sorted = False
         else:
             configs = list(self.providers_config.values())
-
-        if provider:
-            configs = [
-                c for c in configs if provider in [getattr(c, "group", None), c.name]
-            ]
+            pre_sorted = False
 
         if not configs and product_type:
             raise UnsupportedProvider(
@@ -222,7 +301,10 @@ class PluginManager:
         if not configs:
             raise UnsupportedProvider(f"{provider} is not (yet) supported")
 
-        for config in sorted(configs, key=attrgetter("priority"), reverse=True):
+        if not pre_sorted:
+            configs.sort(key=_PRIO_KEY, reverse=True)
+
+        for config in configs:
             yield get_plugin()
 
     def get_download_plugin(self, product: EOProduct) -> Union[Download, Api]:
@@ -234,17 +316,19 @@ class PluginManager:
         :returns: The download plugin capable of downloading the product
         :rtype: :class:`~eodag.plugins.download.Download` or :class:`~eodag.plugins.download.Api`
         """
+        plugin: Union[Download, Api]
         plugin_conf = self.providers_config[product.provider]
         if download := getattr(plugin_conf, "download", None):
             plugin_conf.download.priority = plugin_conf.priority
-            plugin = cast(
-                Download,
-                self._build_plugin(product.provider, download, Download),
+            plugin = self._build_plugin(  # type: ignore[assignment]
+                product.provider, download, Download
             )
         elif api := getattr(plugin_conf, "api", None):
             plugin_conf.api.products = plugin_conf.products
             plugin_conf.api.priority = plugin_conf.priority
-            plugin = cast(Api, self._build_plugin(product.provider, api, Api))
+            plugin = self._build_plugin(  # type: ignore[assignment]
+                product.provider, api, Api
+            )
         else:
             raise MisconfiguredError(
                 f"No download plugin configured for provider {plugin_conf.name}."
@@ -267,11 +351,9 @@ class PluginManager:
             # for an Auth plugin.
             return None
         auth.priority = plugin_conf.priority
-        plugin = cast(
-            Authentication,
-            self._build_plugin(provider, auth, Authentication),
+        return self._build_plugin(  # type: ignore[return-value]
+            provider, auth, Authentication
         )
-        return plugin
 
     @staticmethod
     def get_crunch_plugin(name: str, **options: Any) -> Crunch:
@@ -291,7 +373,7 @@ class PluginManager:
     def sort_providers(self) -> None:
         """Sort providers taking into account current priority order"""
         for provider_configs in self.product_type_to_provider_config_map.values():
-            provider_configs.sort(key=attrgetter("priority"), reverse=True)
+            provider_configs.sort(key=_PRIO_KEY, reverse=True)
 
     def set_priority(self, provider: str, priority: int) -> None:
         """Set the priority of the given provider
@@ -303,19 +385,20 @@ class PluginManager:
         """
         # Update the priority in the configurations so that it is taken into account
         # when a plugin of this provider is latterly built
-        for (
-            _,
-            provider_configs,
-        ) in self.product_type_to_provider_config_map.items():
-            for config in provider_configs:
-                if config.name == provider:
-                    config.priority = priority
-            # Sort the provider configs, taking into account the new priority order
-            provider_configs.sort(key=attrgetter("priority"), reverse=True)
+        priority_changed = False
+        for config in self._provider_to_configs.get(provider, []):
+            if config.priority != priority:
+                config.priority = priority
+                priority_changed = True
+        if priority_changed:
+            # Sort the provider configs of the product types supported by the provider,
+            # taking into account the new priority order
+            for provider_configs in self._provider_to_product_type_providers[provider]:
+                provider_configs.sort(key=_PRIO_KEY, reverse=True)
         # Update the priority of already built plugins of the given provider
-        for provider_name, topic_class in self._built_plugins_cache:
+        for (provider_name, _), plugin in self._built_plugins_cache.items():
             if provider_name == provider:
-                self._built_plugins_cache[(provider, topic_class)].priority = priority
+                plugin.priority = priority
 
     def _build_plugin(
         self,
@@ -338,9 +421,8 @@ class PluginManager:
                 :class:`~eodag.plugin.authentication.Authentication` or
                 :class:`~eodag.plugin.crunch.Crunch`
         """
-        cached_instance = self._built_plugins_cache.setdefault(
-            (provider, topic_class.__name__), None
-        )
+        cache_key = (provider, topic_class)
+        cached_instance = self._built_plugins_cache.get(cache_key)
         if cached_instance is not None:
             return cached_instance
         plugin_class = EODAGPluginMount.get_plugin_by_class_name(
@@ -349,5 +431,5 @@ class PluginManager:
         plugin: Union[Api, Search, Download, Authentication, Crunch] = plugin_class(
             provider, plugin_conf
         )
-        self._built_plugins_cache[(provider, topic_class.__name__)] = plugin
+        self._built_plugins_cache[cache_key] = plugin
         return plugin
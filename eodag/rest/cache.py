@@ -15,16 +15,35 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
+
 import logging
-from typing import Any, Callable, Coroutine, Dict, TypeVar, cast
+import re
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import orjson
 from cachetools import LRUCache
 from fastapi import FastAPI, Request
 
 from eodag.rest.config import Settings
+from eodag.rest.constants import RESPONSE_CACHE_TTL_LONG, RESPONSE_CACHE_TTL_SHORT
 from eodag.utils import urlsplit
 
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
 logger = logging.getLogger("eodag.rest.utils")
 
 T = TypeVar("T")
@@ -35,6 +54,7 @@ def init_cache(app: FastAPI) -> None:
     settings = Settings.from_environment()
 
     app.state.cache = LRUCache(maxsize=settings.cache_maxsize)
+    app.state.response_cache = LRUCache(maxsize=settings.cache_maxsize)
 
 
 async def cached(
@@ -68,3 +88,110 @@ async def cached(
             raise
 
     return result
+
+
+# read-only capability endpoints whose responses are cached, by TTL tier
+_RESPONSE_CACHE_LONG_PATHS = re.compile(
+    r"/(conformance|extensions/oseo/json-schema/schema\.json)?/?"
+)
+_RESPONSE_CACHE_SHORT_PATHS = re.compile(
+    r"/(collections(/[^/]+(/queryables)?)?|queryables|catalogs/(?!(.*/)?items(/|$)).+?)/?"
+)
+
+
+def response_cache_ttl(path: str) -> Optional[int]:
+    """Get the TTL of the cached responses of the given endpoint path
+
+    >>> response_cache_ttl("/conformance")
+    60
+    >>> response_cache_ttl("/collections/S2_MSI_L1C/queryables")
+    10
+    >>> response_cache_ttl("/catalogs/S2_MSI_L1C/year/2020")
+    10
+    >>> response_cache_ttl("/catalogs/S2_MSI_L1C/items") is None
+    True
+
+    :param path: requested endpoint path
+    :type path: str
+    :returns: TTL in seconds, or ``None`` if the endpoint responses must not be cached
+    :rtype: Optional[int]
+    """
+    if _RESPONSE_CACHE_LONG_PATHS.fullmatch(path):
+        return RESPONSE_CACHE_TTL_LONG
+    if _RESPONSE_CACHE_SHORT_PATHS.fullmatch(path):
+        return RESPONSE_CACHE_TTL_SHORT
+    return None
+
+
+async def _send_response(
+    send: Send, status: int, headers: List[Tuple[bytes, bytes]], body: bytes
+) -> None:
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware caching the responses of read-only capability endpoints
+
+    Responses are kept in ``app.state.response_cache`` (see :func:`init_cache`), keyed
+    by method, url root, path and query string. An expired response is still served if the
+    endpoint fails while refreshing it.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the response from cache, or call the wrapped app and cache its response"""
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        ttl = response_cache_ttl(scope["path"])
+        c: Optional[Dict[str, Any]] = getattr(
+            scope["app"].state, "response_cache", None
+        )
+        if ttl is None or c is None:
+            await self.app(scope, receive, send)
+            return
+
+        # url root (scheme and host) is used in the links of cached responses
+        url_root = scope.get("state", {}).get("url_root", "")
+        query_string = scope["query_string"].decode("latin-1")
+        cache_key = f"{scope['method']}:{url_root}{scope['path']}?{query_string}"
+
+        cached_response = c.get(cache_key)
+        if cached_response is not None and cached_response[0] > time.monotonic():
+            logger.debug("Response cache hit")
+            await _send_response(send, *cached_response[1:])
+            return
+
+        response_start: Message = {}
+        body_parts: List[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_start.update(message)
+            elif message["type"] == "http.response.body":
+                body_parts.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            if cached_response is None:
+                raise
+            logger.warning("Serving stale response after error", exc_info=True)
+            await _send_response(send, *cached_response[1:])
+            return
+
+        status = response_start["status"]
+        if status >= 500 and cached_response is not None:
+            logger.warning(f"Serving stale response after {status} error")
+            await _send_response(send, *cached_response[1:])
+            return
+
+        headers = list(response_start.get("headers", []))
+        body = b"".join(body_parts)
+        if status == 200:
+            c[cache_key] = (time.monotonic() + ttl, status, headers, body)
+        await _send_response(send, status, headers, body)
@@ -25,3 +25,7 @@ CACHE_KEY_COLLECTION = "collection"
 CACHE_KEY_SEARCH = "search"
 CACHE_KEY_QUERYABLES = "queryables"
 CACHE_KEY_CATALOGS = "catalogs"
+
+# response cache ttl of read-only capability endpoints
+RESPONSE_CACHE_TTL_SHORT = 10  # collections, queryables, catalogs
+RESPONSE_CACHE_TTL_LONG = 60  # landing page, conformance, oseo json schema
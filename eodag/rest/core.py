@@ -25,7 +25,9 @@ from typing import TYPE_CHECKING, cast
 from unittest.mock import Mock
 
 import dateutil
+import orjson
 from cachetools.func import lru_cache
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import ValidationError as pydanticValidationError
 from requests.models import Response as RequestsResponse
@@ -409,7 +411,7 @@ async def all_collections(
     :rtype: dict
     """
 
-    async def _fetch() -> Dict[str, Any]:
+    def _build() -> Dict[str, Any]:
         stac_collection = StacCollection(
             url=request.state.url,
             stac_config=stac_config,
@@ -439,6 +441,10 @@ async def all_collections(
         collections = format_dict_items(collections, **format_args)
         return collections
 
+    async def _fetch() -> Dict[str, Any]:
+        # local but CPU-bound build over all product types: keep it off the event loop
+        return await run_in_threadpool(_build)
+
     hashed_collections = hash(f"{provider}:{q}:{platform}:{instrument}:{constellation}")
     cache_key = f"{CACHE_KEY_COLLECTIONS}:{hashed_collections}"
     return await cached(_fetch, cache_key, request)
@@ -569,6 +575,16 @@ def get_stac_conformance() -> Dict[str, str]:
     return stac_config["conformance"]
 
 
+@lru_cache(maxsize=1)
+def get_stac_conformance_json() -> bytes:
+    """Build STAC conformance, serialized once as JSON
+
+    :returns: conformance JSON
+    :rtype: bytes
+    """
+    return orjson.dumps(get_stac_conformance())
+
+
 def get_stac_api_version() -> str:
     """Get STAC API version
 
@@ -608,6 +624,29 @@ def get_stac_extension_oseo(url: str) -> Dict[str, str]:
     )
 
 
+# url placeholder of the pre-serialized STAC OGC / OpenSearch Extension for EO
+_OSEO_URL_PLACEHOLDER = "__eodag_oseo_url__"
+
+
+@lru_cache(maxsize=1)
+def _get_stac_extension_oseo_template() -> bytes:
+    return orjson.dumps(get_stac_extension_oseo(url=_OSEO_URL_PLACEHOLDER))
+
+
+def get_stac_extension_oseo_json(url: str) -> bytes:
+    """Build STAC OGC / OpenSearch Extension for EO as JSON, from a template
+    serialized once for all requested URLs
+
+    :param url: Requested URL
+    :type url: str
+    :returns: Extension JSON
+    :rtype: bytes
+    """
+    return _get_stac_extension_oseo_template().replace(
+        _OSEO_URL_PLACEHOLDER.encode(), orjson.dumps(url)[1:-1]
+    )
+
+
 async def get_queryables(
     request: Request,
     params: QueryablesGetParams,
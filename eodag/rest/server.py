@@ -17,13 +17,13 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
 import traceback
 from contextlib import asynccontextmanager
 from importlib.metadata import version
-from json import JSONDecodeError
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -34,18 +34,19 @@ from typing import (
     Optional,
 )
 
+import orjson
 from fastapi import APIRouter as FastAPIRouter
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pydantic import ValidationError as pydanticValidationError
-from pygeofilter.backends.cql2_json import to_cql2
-from pygeofilter.parsers.cql2_text import parse as parse_cql2_text
+from starlette.datastructures import URL
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from eodag.config import load_stac_api_config
-from eodag.rest.cache import init_cache
+from eodag.rest.cache import ResponseCacheMiddleware, init_cache
 from eodag.rest.core import (
     all_collections,
     download_stac_item,
@@ -55,15 +56,20 @@ from eodag.rest.core import (
     get_queryables,
     get_stac_api_version,
     get_stac_catalogs,
-    get_stac_conformance,
-    get_stac_extension_oseo,
+    get_stac_conformance_json,
+    get_stac_extension_oseo_json,
     search_stac_items,
 )
 from eodag.rest.types.eodag_search import EODAGSearch
 from eodag.rest.types.queryables import QueryablesGetParams
 from eodag.rest.types.stac_search import SearchPostRequest, sortby2list
-from eodag.rest.utils import format_pydantic_error, str2json, str2list
-from eodag.utils import parse_header, update_nested_dict
+from eodag.rest.utils import (
+    cql2_text_to_json,
+    format_pydantic_error,
+    str2json,
+    str2list,
+)
+from eodag.utils import update_nested_dict
 from eodag.utils.exceptions import (
     AuthenticationError,
     DownloadError,
@@ -79,17 +85,15 @@ from eodag.utils.exceptions import (
 
 if TYPE_CHECKING:
     from fastapi.types import DecoratedCallable
-    from requests import Response
+    from starlette.types import ASGIApp, Receive, Scope, Send
 
 from starlette.responses import Response as StarletteResponse
 
 logger = logging.getLogger("eodag.rest.server")
-ERRORS_WITH_500_STATUS_CODE = {
-    "MisconfiguredError",
-    "AuthenticationError",
-    "DownloadError",
-    "RequestError",
-}
+ERRORS_WITH_500_STATUS_CODE = frozenset(
+    {MisconfiguredError, AuthenticationError, DownloadError, RequestError}
+)
+FILTER_LANG_REGEX = re.compile(r"filter-lang=([a-z0-9-]+)", re.IGNORECASE)
 
 
 class APIRouter(FastAPIRouter):
@@ -98,28 +102,14 @@ class APIRouter(FastAPIRouter):
     def api_route(
         self, path: str, *, include_in_schema: bool = True, **kwargs: Any
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
-        """Creates API route decorator"""
-        if path == "/":
-            return super().api_route(
-                path, include_in_schema=include_in_schema, **kwargs
-            )
+        """Creates API route decorator
 
-        if path.endswith("/"):
+        Routes are registered without ending slash, which is stripped from requested
+        paths by :class:`TrailingSlashMiddleware`
+        """
+        if path != "/" and path.endswith("/"):
             path = path[:-1]
-        add_path = super().api_route(
-            path, include_in_schema=include_in_schema, **kwargs
-        )
-
-        alternate_path = path + "/"
-        add_alternate_path = super().api_route(
-            alternate_path, include_in_schema=False, **kwargs
-        )
-
-        def decorator(func: DecoratedCallable) -> DecoratedCallable:
-            add_alternate_path(func)
-            return add_path(func)
-
-        return decorator
+        return super().api_route(path, include_in_schema=include_in_schema, **kwargs)
 
 
 router = APIRouter()
@@ -133,59 +123,97 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
 
-app = FastAPI(lifespan=lifespan, title="EODAG", docs_url="/api.html")
+app = FastAPI(
+    lifespan=lifespan,
+    title="EODAG",
+    docs_url="/api.html",
+    default_response_class=ORJSONResponse,
+)
 
 # conf from resources/stac_api.yml
 stac_api_config = load_stac_api_config()
 
 
-@router.api_route(
-    methods=["GET", "HEAD"], path="/api", tags=["Capabilities"], include_in_schema=False
-)
 async def eodag_openapi(request: Request) -> Dict[str, Any]:
     """Customized openapi"""
-    logger.debug("URL: /api")
     if app.openapi_schema:
         return app.openapi_schema
 
-    root_catalog = await get_stac_catalogs(request=request, url="")
-    stac_api_version = get_stac_api_version()
+    # guards the schema construction on concurrent first requests, created on first use
+    # to be bound to the running event loop (python < 3.10 binds it on creation)
+    openapi_schema_lock = getattr(app.state, "openapi_schema_lock", None)
+    if openapi_schema_lock is None:
+        openapi_schema_lock = app.state.openapi_schema_lock = asyncio.Lock()
 
-    openapi_schema = get_openapi(
-        title=f"{root_catalog['title']} / eodag",
-        version=version("eodag"),
-        routes=app.routes,
-    )
+    async with openapi_schema_lock:
+        if app.openapi_schema:
+            return app.openapi_schema
 
-    # stac_api_config
-    update_nested_dict(openapi_schema["paths"], stac_api_config["paths"])
-    try:
-        update_nested_dict(openapi_schema["components"], stac_api_config["components"])
-    except KeyError:
-        openapi_schema["components"] = stac_api_config["components"]
-    openapi_schema["tags"] = stac_api_config["tags"]
-
-    detailled_collections_list = get_detailled_collections_list()
-
-    openapi_schema["info"]["description"] = (
-        root_catalog["description"]
-        + f" (stac-api-spec {stac_api_version})"
-        + "<details><summary>Available collections / product types</summary>"
-        + "".join(
-            [
-                f"[{pt['ID']}](/collections/{pt['ID']} '{pt['title']}') - "
-                for pt in detailled_collections_list
-            ]
-        )[:-2]
-        + "</details>"
-    )
+        root_catalog = await get_stac_catalogs(request=request, url="")
+        stac_api_version = get_stac_api_version()
+
+        openapi_schema = get_openapi(
+            title=f"{root_catalog['title']} / eodag",
+            version=version("eodag"),
+            routes=app.routes,
+        )
+
+        # stac_api_config operations replace the generated ones of the same path
+        generated_paths = openapi_schema["paths"]
+        openapi_schema["paths"] = {
+            **generated_paths,
+            **{
+                path: {**generated_paths.get(path, {}), **operations}
+                for path, operations in stac_api_config["paths"].items()
+            },
+        }
+        update_nested_dict(
+            openapi_schema.setdefault("components", {}), stac_api_config["components"]
+        )
+        openapi_schema["tags"] = stac_api_config["tags"]
+
+        detailled_collections_list = get_detailled_collections_list()
+
+        openapi_schema["info"]["description"] = (
+            root_catalog["description"]
+            + f" (stac-api-spec {stac_api_version})"
+            + "<details><summary>Available collections / product types</summary>"
+            + " - ".join(
+                [
+                    f"[{pt['ID']}](/collections/{pt['ID']} '{pt['title']}')"
+                    for pt in detailled_collections_list
+                ]
+            )
+            + "</details>"
+        )
 
-    app.openapi_schema = openapi_schema
+        app.openapi_schema = openapi_schema
     return app.openapi_schema
 
 
 app.__setattr__("openapi", eodag_openapi)
 
+
+@router.api_route(
+    methods=["GET", "HEAD"], path="/api", tags=["Capabilities"], include_in_schema=False
+)
+async def openapi_json(request: Request) -> StarletteResponse:
+    """Customized openapi, serialized once"""
+    logger.debug("URL: /api")
+    openapi_schema_json = getattr(app.state, "openapi_schema_json", None)
+    if openapi_schema_json is None:
+        openapi_schema_json = orjson.dumps(
+            await eodag_openapi(request), option=orjson.OPT_NON_STR_KEYS
+        )
+        app.state.openapi_schema_json = openapi_schema_json
+
+    return StarletteResponse(content=openapi_schema_json, media_type="application/json")
+
+
+# response cache, wrapped by CORS which adds headers depending on the request origin,
+# and by forward headers handling which sets the request url root
+app.add_middleware(ResponseCacheMiddleware)
+
 # Cross-Origin Resource Sharing
 allowed_origins = os.getenv("EODAG_CORS_ALLOWED_ORIGINS")
 allowed_origins_list = allowed_origins.split(",") if allowed_origins else []
@@ -193,32 +221,123 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins_list,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # explicit lists let preflight responses use precomputed allowed values
+    allow_methods=["GET", "HEAD", "POST", "OPTIONS"],
+    allow_headers=[
+        "Content-Type",
+        "Authorization",
+        "X-Forwarded-Host",
+        "X-Forwarded-Proto",
+        "Forwarded",
+    ],
 )
 
 
-@app.middleware("http")
-async def forward_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """Middleware that handles forward headers and sets request.state.url*"""
+def parse_forwarded(forwarded: str) -> Dict[str, str]:
+    """Parse the parameters of the first element of a Forwarded header (RFC 7239)
+
+    >>> parse_forwarded('for=192.0.2.1;Host="foo:8080";proto=https, for=192.0.2.2')
+    {'for': '192.0.2.1', 'host': 'foo:8080', 'proto': 'https'}
+
+    :param forwarded: Forwarded header value
+    :type forwarded: str
+    :returns: parameters with lowercase names and unquoted values
+    :rtype: dict
+    """
+    params: Dict[str, str] = {}
+    for pair in forwarded.split(",", 1)[0].split(";"):
+        name, sep, value = pair.partition("=")
+        if sep:
+            params[name.strip().lower()] = value.strip().strip('"')
+    return params
+
+
+class ForwardHeaderMiddleware:
+    """ASGI middleware that handles forward headers and sets request.state.url*"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Set url_root and url in the request state, then call the wrapped app"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        forwarded_host: Optional[str] = None
+        forwarded_proto: Optional[str] = None
+        forwarded: Optional[str] = None
+        for key, value in scope["headers"]:
+            if key == b"x-forwarded-host" and forwarded_host is None:
+                forwarded_host = value.decode("latin-1")
+            elif key == b"x-forwarded-proto" and forwarded_proto is None:
+                forwarded_proto = value.decode("latin-1")
+            elif key == b"forwarded" and forwarded is None:
+                forwarded = value.decode("latin-1")
+
+        if forwarded is not None:
+            forwarded_params = parse_forwarded(forwarded)
+            forwarded_host = forwarded_params.get("host") or forwarded_host
+            forwarded_proto = forwarded_params.get("proto") or forwarded_proto
+
+        url = URL(scope=scope)
+        url_root = f"{forwarded_proto or url.scheme}://{forwarded_host or url.netloc}"
+        state = scope.setdefault("state", {})
+        state["url_root"] = url_root
+        state["url"] = f"{url_root}{url.path}"
 
-    forwarded_host = request.headers.get("x-forwarded-host", None)
-    forwarded_proto = request.headers.get("x-forwarded-proto", None)
+        await self.app(scope, receive, send)
 
-    if "forwarded" in request.headers:
-        header_forwarded = parse_header(request.headers["forwarded"])
-        forwarded_host = str(header_forwarded.get_param("host", None)) or forwarded_host
-        forwarded_proto = (
-            str(header_forwarded.get_param("proto", None)) or forwarded_proto
+
+app.add_middleware(ForwardHeaderMiddleware)
+
+
+class TrailingSlashMiddleware:
+    """ASGI middleware that strips the ending slash of requested paths"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Strip the ending slash of the path, then call the wrapped app"""
+        if scope["type"] == "http":
+            path = scope["path"]
+            if len(path) > 1 and path.endswith("/"):
+                scope["path"] = path.rstrip("/") or "/"
+
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(TrailingSlashMiddleware)
+
+
+# opt-in profiling of requests having a profile query parameter
+if os.getenv("EODAG_PROFILE"):
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        raise ImportError(
+            "Profiling not available, please install pyinstrument or unset EODAG_PROFILE"
         )
 
-    request.state.url_root = f"{forwarded_proto or request.url.scheme}://{forwarded_host or request.url.netloc}"
-    request.state.url = f"{request.state.url_root}{request.url.path}"
+    @app.middleware("http")
+    async def profile_request(
+        request: Request,
+        call_next: Callable[[Request], Awaitable[StarletteResponse]],
+    ) -> StarletteResponse:
+        """Profile the request and respond with the profiler HTML output"""
+        if request.query_params.get("profile", "").lower() not in ("1", "true", "yes"):
+            return await call_next(request)
 
-    response = await call_next(request)
-    return response
+        profiler = Profiler(interval=0.001, async_mode="enabled")
+        profiler.start()
+        response = await call_next(request)
+        # consume the response to also profile its streamed content
+        async for _ in response.body_iterator:  # type: ignore[attr-defined]
+            pass
+        profiler.stop()
+
+        return HTMLResponse(profiler.output_html())
 
 
 @app.exception_handler(StarletteHTTPException)
@@ -315,20 +434,28 @@ async def handle_download_error(request: Request, error: Exception) -> ORJSONRes
 async def handle_request_error(request: Request, error: RequestError) -> ORJSONResponse:
     """RequestError should be sent as internal server error with details to the client"""
     if getattr(error, "history", None):
-        error_history_tmp = list(error.history)
-        for i, search_error in enumerate(error_history_tmp):
-            if search_error[1].__class__.__name__ in ERRORS_WITH_500_STATUS_CODE:
-                search_error[1].args = ("an internal error occured",)
-                error_history_tmp[i] = search_error
-                continue
-            if getattr(error, "parameters", None):
-                for error_param in error.parameters:
-                    stac_param = EODAGSearch.to_stac(error_param)
-                    search_error[1].args = (
-                        search_error[1].args[0].replace(error_param, stac_param),
-                    )
-                    error_history_tmp[i] = search_error
-        error.history = set(error_history_tmp)
+        # eodag parameters to rename in messages, longest first to match them greedily
+        params_to_stac = {
+            param: stac_param
+            for param in sorted(getattr(error, "parameters", None) or (), key=len)[::-1]
+            if (stac_param := EODAGSearch.to_stac(param)) != param
+        }
+        params_regex = (
+            re.compile("|".join(map(re.escape, params_to_stac)))
+            if params_to_stac
+            else None
+        )
+        # history errors are updated in place: no need to rebuild the history set
+        for _, search_error in error.history:
+            # exact type match: subclasses like TimeOutError keep their message
+            if type(search_error) in ERRORS_WITH_500_STATUS_CODE:
+                search_error.args = ("an internal error occured",)
+            elif params_regex is not None and search_error.args:
+                search_error.args = (
+                    params_regex.sub(
+                        lambda m: params_to_stac[m.group()], str(search_error.args[0])
+                    ),
+                )
     logger.error(f"{type(error).__name__}: {str(error)}")
     return await default_exception_handler(
         request,
@@ -367,12 +494,13 @@ async def catalogs_root(request: Request) -> ORJSONResponse:
 
 
 @router.api_route(methods=["GET", "HEAD"], path="/conformance", tags=["Capabilities"])
-def conformance() -> ORJSONResponse:
+async def conformance() -> StarletteResponse:
     """STAC conformance"""
     logger.debug("URL: /conformance")
-    response = get_stac_conformance()
 
-    return ORJSONResponse(response)
+    return StarletteResponse(
+        content=get_stac_conformance_json(), media_type="application/json"
+    )
 
 
 @router.api_route(
@@ -380,12 +508,14 @@ def conformance() -> ORJSONResponse:
     path="/extensions/oseo/json-schema/schema.json",
     include_in_schema=False,
 )
-def stac_extension_oseo(request: Request) -> ORJSONResponse:
+async def stac_extension_oseo(request: Request) -> StarletteResponse:
     """STAC OGC / OpenSearch extension for EO"""
     logger.debug("URL: %s", request.url)
-    response = get_stac_extension_oseo(url=request.state.url)
 
-    return ORJSONResponse(response)
+    return StarletteResponse(
+        content=get_stac_extension_oseo_json(url=request.state.url),
+        media_type="application/json",
+    )
 
 
 @router.api_route(
@@ -394,16 +524,16 @@ def stac_extension_oseo(request: Request) -> ORJSONResponse:
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_collections_item_download(
-    collection_id: str, item_id: str, request: Request
+async def stac_collections_item_download(
+    collection_id: str, item_id: str, request: Request, provider: Optional[str] = None
 ) -> StarletteResponse:
     """STAC collection item download"""
     logger.debug("URL: %s", request.url)
 
-    arguments = dict(request.query_params)
-    provider = arguments.pop("provider", None)
+    arguments = {k: v for k, v in request.query_params.items() if k != "provider"}
 
-    return download_stac_item(
+    return await run_in_threadpool(
+        download_stac_item,
         request=request,
         catalogs=[collection_id],
         item_id=item_id,
@@ -418,16 +548,18 @@ def stac_collections_item_download(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_collections_item_download_asset(
-    collection_id: str, item_id: str, asset: str, request: Request
+async def stac_collections_item_download_asset(
+    collection_id: str,
+    item_id: str,
+    asset: str,
+    request: Request,
+    provider: Optional[str] = None,
 ):
     """STAC collection item asset download"""
     logger.debug("URL: %s", request.url)
 
-    arguments = dict(request.query_params)
-    provider = arguments.pop("provider", None)
-
-    return download_stac_item(
+    return await run_in_threadpool(
+        download_stac_item,
         request=request,
         catalogs=[collection_id],
         item_id=item_id,
@@ -442,22 +574,28 @@ def stac_collections_item_download_asset(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_collections_item(
+async def stac_collections_item(
     collection_id: str, item_id: str, request: Request, provider: Optional[str] = None
 ) -> ORJSONResponse:
     """STAC collection item by id"""
     logger.debug("URL: %s", request.url)
 
-    search_request = SearchPostRequest(
+    # path and provider params are already validated strings: skip model validation
+    search_request = SearchPostRequest.model_construct(
         provider=provider, ids=[item_id], collections=[collection_id], limit=1
     )
 
-    item_collection = search_stac_items(request, search_request)
+    item_collection = await run_in_threadpool(
+        search_stac_items, request, search_request
+    )
 
     if not item_collection["features"]:
-        raise HTTPException(
+        # same response as default_exception_handler, without raising
+        return ORJSONResponse(
             status_code=404,
-            detail=f"Item {item_id} in Collection {collection_id} does not exist.",
+            content={
+                "description": f"Item {item_id} in Collection {collection_id} does not exist."
+            },
         )
 
     return ORJSONResponse(item_collection["features"][0])
@@ -469,7 +607,7 @@ def stac_collections_item(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_collections_items(
+async def stac_collections_items(
     collection_id: str,
     request: Request,
     provider: Optional[str] = None,
@@ -485,7 +623,7 @@ def stac_collections_items(
 ) -> ORJSONResponse:
     """Fetch collection's features"""
 
-    return get_search(
+    return await get_search(
         request=request,
         provider=provider,
         collections=collection_id,
@@ -511,6 +649,7 @@ def stac_collections_items(
 async def list_collection_queryables(
     request: Request,
     collection_id: str,
+    provider: Optional[str] = None,
 ) -> ORJSONResponse:
     """Returns the list of queryable properties for a specific collection.
 
@@ -522,17 +661,19 @@ async def list_collection_queryables(
     :type request: fastapi.Request
     :param collection_id: The identifier of the collection for which to retrieve queryable properties.
     :type collection_id: str
+    :param provider: (optional) The provider from which queryables are retrieved.
+    :type provider: str
     :returns: A json object containing the list of available queryable properties for the specified collection.
     :rtype: Any
     """
     logger.debug(f"URL: {request.url}")
-    additional_params = dict(request.query_params)
-    provider = additional_params.pop("provider", None)
+    params: Dict[str, Any] = {
+        k: v for k, v in request.query_params.items() if k != "provider"
+    }
+    params["collection"] = collection_id
 
     queryables = await get_queryables(
-        request,
-        QueryablesGetParams(collection=collection_id, **additional_params),
-        provider=provider,
+        request, QueryablesGetParams.model_validate(params), provider=provider
     )
 
     return ORJSONResponse(queryables)
@@ -593,18 +734,18 @@ async def collections(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_catalogs_item_download(
-    catalogs: str, item_id: str, request: Request
+async def stac_catalogs_item_download(
+    catalogs: str, item_id: str, request: Request, provider: Optional[str] = None
 ) -> StarletteResponse:
     """STAC Catalog item download"""
     logger.debug("URL: %s", request.url)
 
-    arguments = dict(request.query_params)
-    provider = arguments.pop("provider", None)
+    arguments = {k: v for k, v in request.query_params.items() if k != "provider"}
 
     list_catalog = catalogs.strip("/").split("/")
 
-    return download_stac_item(
+    return await run_in_threadpool(
+        download_stac_item,
         request=request,
         catalogs=list_catalog,
         item_id=item_id,
@@ -619,18 +760,22 @@ def stac_catalogs_item_download(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_catalogs_item_download_asset(
-    catalogs: str, item_id: str, asset_filter: str, request: Request
+async def stac_catalogs_item_download_asset(
+    catalogs: str,
+    item_id: str,
+    asset_filter: str,
+    request: Request,
+    provider: Optional[str] = None,
 ):
     """STAC Catalog item asset download"""
     logger.debug("URL: %s", request.url)
 
-    arguments = dict(request.query_params)
-    provider = arguments.pop("provider", None)
+    arguments = {k: v for k, v in request.query_params.items() if k != "provider"}
 
     list_catalog = catalogs.strip("/").split("/")
 
-    return download_stac_item(
+    return await run_in_threadpool(
+        download_stac_item,
         request,
         catalogs=list_catalog,
         item_id=item_id,
@@ -646,7 +791,7 @@ def stac_catalogs_item_download_asset(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_catalogs_item(
+async def stac_catalogs_item(
     catalogs: str, item_id: str, request: Request, provider: Optional[str] = None
 ):
     """Fetch catalog's single features."""
@@ -654,14 +799,22 @@ def stac_catalogs_item(
 
     list_catalog = catalogs.strip("/").split("/")
 
-    search_request = SearchPostRequest(provider=provider, ids=[item_id], limit=1)
+    # path and provider params are already validated strings: skip model validation
+    search_request = SearchPostRequest.model_construct(
+        provider=provider, ids=[item_id], limit=1
+    )
 
-    item_collection = search_stac_items(request, search_request, catalogs=list_catalog)
+    item_collection = await run_in_threadpool(
+        search_stac_items, request, search_request, catalogs=list_catalog
+    )
 
     if not item_collection["features"]:
-        raise HTTPException(
+        # same response as default_exception_handler, without raising
+        return ORJSONResponse(
             status_code=404,
-            detail=f"Item {item_id} in Catalog {catalogs} does not exist.",
+            content={
+                "description": f"Item {item_id} in Catalog {catalogs} does not exist."
+            },
         )
 
     return ORJSONResponse(item_collection["features"][0])
@@ -673,7 +826,7 @@ def stac_catalogs_item(
     tags=["Data"],
     include_in_schema=False,
 )
-def stac_catalogs_items(
+async def stac_catalogs_items(
     catalogs: str,
     request: Request,
     provider: Optional[str] = None,
@@ -687,17 +840,22 @@ def stac_catalogs_items(
     """Fetch catalog's features"""
     logger.debug("URL: %s", request.state.url)
 
-    base_args = {
-        "provider": provider,
-        "datetime": datetime,
-        "bbox": str2list(bbox),
-        "limit": limit,
-        "page": page,
-        "sortby": sortby2list(sortby),
-        "crunch": crunch,
-    }
-
-    clean = {k: v for k, v in base_args.items() if v is not None and v != []}
+    # only set parameters, converted when needed
+    clean: Dict[str, Any] = {}
+    if provider is not None:
+        clean["provider"] = provider
+    if datetime is not None:
+        clean["datetime"] = datetime
+    if bbox:
+        clean["bbox"] = str2list(bbox)
+    if limit is not None:
+        clean["limit"] = limit
+    if page is not None:
+        clean["page"] = page
+    if sortby:
+        clean["sortby"] = sortby2list(sortby)
+    if crunch is not None:
+        clean["crunch"] = crunch
 
     list_catalog = catalogs.strip("/").split("/")
 
@@ -706,7 +864,8 @@ def stac_catalogs_items(
     except pydanticValidationError as e:
         raise HTTPException(status_code=400, detail=format_pydantic_error(e)) from e
 
-    response = search_stac_items(
+    response = await run_in_threadpool(
+        search_stac_items,
         request=request,
         search_request=search_request,
         catalogs=list_catalog,
@@ -749,7 +908,9 @@ async def stac_catalogs(
     response_model_exclude_none=True,
     include_in_schema=False,
 )
-async def list_queryables(request: Request) -> ORJSONResponse:
+async def list_queryables(
+    request: Request, provider: Optional[str] = None
+) -> ORJSONResponse:
     """Returns the list of terms available for use when writing filter expressions.
 
     This endpoint provides a list of terms that can be used as filters when querying
@@ -758,14 +919,15 @@ async def list_queryables(request: Request) -> ORJSONResponse:
 
     :param request: The incoming request object.
     :type request: fastapi.Request
+    :param provider: (optional) The provider from which queryables are retrieved.
+    :type provider: str
     :returns: A json object containing the list of available queryable terms.
     :rtype: Any
     """
     logger.debug(f"URL: {request.url}")
-    additional_params = dict(request.query_params.items())
-    provider = additional_params.pop("provider", None)
+    params = {k: v for k, v in request.query_params.items() if k != "provider"}
     queryables = await get_queryables(
-        request, QueryablesGetParams(**additional_params), provider=provider
+        request, QueryablesGetParams.model_validate(params), provider=provider
     )
 
     return ORJSONResponse(queryables)
@@ -777,7 +939,7 @@ async def list_queryables(request: Request) -> ORJSONResponse:
     tags=["STAC"],
     include_in_schema=False,
 )
-def get_search(
+async def get_search(
     request: Request,
     provider: Optional[str] = None,
     collections: Optional[str] = None,
@@ -796,44 +958,55 @@ def get_search(
     """Handler for GET /search"""
     logger.debug("URL: %s", request.state.url)
 
-    query_params = str(request.query_params)
-
     # Kludgy fix because using factory does not allow alias for filter-lang
     if filter_lang is None:
-        match = re.search(r"filter-lang=([a-z0-9-]+)", query_params, re.IGNORECASE)
+        filter_lang = request.query_params.get("filter-lang")
+    if filter_lang is None:
+        match = FILTER_LANG_REGEX.search(request.url.query)
         if match:
             filter_lang = match.group(1)
 
-    base_args = {
-        "provider": provider,
-        "collections": str2list(collections),
-        "ids": str2list(ids),
-        "datetime": datetime,
-        "bbox": str2list(bbox),
-        "intersects": str2json("intersects", intersects),
-        "limit": limit,
-        "query": str2json("query", query),
-        "page": page,
-        "sortby": sortby2list(sortby),
-        "crunch": crunch,
-    }
+    # only set parameters, converted when needed
+    clean: Dict[str, Any] = {}
+    if provider is not None:
+        clean["provider"] = provider
+    if collections:
+        clean["collections"] = str2list(collections)
+    if ids:
+        clean["ids"] = str2list(ids)
+    if datetime is not None:
+        clean["datetime"] = datetime
+    if bbox:
+        clean["bbox"] = str2list(bbox)
+    if intersects:
+        clean["intersects"] = str2json("intersects", intersects)
+    if limit is not None:
+        clean["limit"] = limit
+    if query:
+        clean["query"] = str2json("query", query)
+    if page is not None:
+        clean["page"] = page
+    if sortby:
+        clean["sortby"] = sortby2list(sortby)
+    if crunch is not None:
+        clean["crunch"] = crunch
 
     if filter:
         if filter_lang == "cql2-text":
-            ast = parse_cql2_text(filter)
-            base_args["filter"] = str2json("filter", to_cql2(ast))  # type: ignore
-            base_args["filter-lang"] = "cql2-json"
+            clean["filter"] = cql2_text_to_json(filter)
+            clean["filter-lang"] = "cql2-json"
         elif filter_lang == "cql-json":
-            base_args["filter"] = str2json(filter)
-
-    clean = {k: v for k, v in base_args.items() if v is not None and v != []}
+            cql_json_filter = str2json(filter)
+            if cql_json_filter is not None:
+                clean["filter"] = cql_json_filter
 
     try:
         search_request = SearchPostRequest.model_validate(clean)
     except pydanticValidationError as e:
         raise HTTPException(status_code=400, detail=format_pydantic_error(e)) from e
 
-    response = search_stac_items(
+    response = await run_in_threadpool(
+        search_stac_items,
         request=request,
         search_request=search_request,
     )
@@ -858,8 +1031,8 @@ async def post_search(request: Request) -> ORJSONResponse:
         raise HTTPException(status_code=400, detail="Content-Type not supported")
 
     try:
-        payload = await request.json()
-    except JSONDecodeError as e:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
         raise HTTPException(status_code=400, detail="Invalid JSON data") from e
 
     try:
@@ -869,7 +1042,8 @@ async def post_search(request: Request) -> ORJSONResponse:
 
     logger.debug("Body: %s", search_request.model_dump(exclude_none=True))
 
-    response = search_stac_items(
+    response = await run_in_threadpool(
+        search_stac_items,
         request=request,
         search_request=search_request,
     )
@@ -39,6 +39,8 @@ from urllib.parse import unquote_plus, urlencode
 import orjson
 from fastapi import Request
 from pydantic import ValidationError as pydanticValidationError
+from pygeofilter.backends.cql2_json.evaluate import CQL2Evaluator, json_serializer
+from pygeofilter.parsers.cql2_text import parse as parse_cql2_text
 
 from eodag.plugins.crunch.filter_latest_intersect import FilterLatestIntersect
 from eodag.plugins.crunch.filter_latest_tpl_name import FilterLatestByName
@@ -109,6 +111,33 @@ def str2json(k: str, v: Optional[str] = None) -> Optional[Dict[str, Any]]:
         raise ValidationError(f"{k}: Incorrect JSON object") from e
 
 
+def _to_json_compatible(value: Any) -> Any:
+    """Convert a value to its JSON-decoded equivalent, as done by the CQL2-JSON backend
+    serializer, without going through its JSON representation"""
+    if isinstance(value, dict):
+        return {k: _to_json_compatible(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_compatible(v) for v in value]
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json_serializer(value)
+
+
+def cql2_text_to_json(cql2_text: str) -> Dict[str, Any]:
+    """Convert a CQL2-text filter to a CQL2-JSON filter dict
+
+    >>> cql2_text_to_json("cloudCover < 10")
+    {'op': '<', 'args': [{'property': 'cloudCover'}, 10]}
+
+    :param cql2_text: CQL2-text filter
+    :type cql2_text: str
+    :returns: CQL2-JSON filter
+    :rtype: dict
+    """
+    ast = parse_cql2_text(cql2_text)
+    return _to_json_compatible(CQL2Evaluator(None, None).evaluate(ast))
+
+
 def flatten_list(nested_list: Union[Any, List[Any]]) -> List[Any]:
     """Flatten a nested list structure into a single list."""
     if not isinstance(nested_list, list):
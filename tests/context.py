@@ -63,7 +63,11 @@ from eodag.plugins.download.base import (
     DEFAULT_DOWNLOAD_WAIT,
 )
 from eodag.plugins.download.http import HTTPDownload
-from eodag.plugins.manager import PluginManager
+from eodag.plugins.manager import (
+    PluginManager,
+    _find_plugin_providers_configs,
+    entry_points,
+)
 from eodag.plugins.search import PreparedSearch
 from eodag.plugins.search.base import Search
 from eodag.types import model_fields_to_annotated
@@ -16,13 +16,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import shutil
+import sys
 import unittest
 from tempfile import TemporaryDirectory
 
-import pkg_resources
-
-from tests import TEST_RESOURCES_PATH
-from tests.context import EODataAccessGateway
+from tests import TEST_RESOURCES_PATH, temporary_environment
+from tests.context import (
+    EODataAccessGateway,
+    _find_plugin_providers_configs,
+    entry_points,
+)
 from tests.utils import mock
 
 
@@ -43,38 +47,92 @@ class TestExternalPluginConfig(unittest.TestCase):
 
         self.dag.providers_config.pop("fakeplugin_provider", None)
 
-        # remove entry point manually, see https://github.com/pypa/setuptools/issues/1759
-        distpath = pkg_resources.working_set.by_key.pop("eodag-fakeplugin").location
-        pkg_resources.working_set.entry_keys.pop(distpath)
-        pkg_resources.working_set.entries.remove(distpath)
-
         # stop Mock and remove tmp config dir
         self.expanduser_mock.stop()
         self.tmp_home_dir.cleanup()
 
+    def install_fake_plugin(self, providers_conf_dir: str = "") -> str:
+        """Install the fake external plugin as a distribution in a temporary directory
+        added to ``sys.path``, with its providers config in ``providers_conf_dir``"""
+        fakeplugin_location = TemporaryDirectory()
+        self.addCleanup(fakeplugin_location.cleanup)
+        fakeplugin_src = os.path.join(
+            TEST_RESOURCES_PATH, "fake_ext_plugin", "eodag_fakeplugin"
+        )
+        package_dir = os.path.join(fakeplugin_location.name, "eodag_fakeplugin")
+        os.makedirs(os.path.join(package_dir, providers_conf_dir))
+        shutil.copy(os.path.join(fakeplugin_src, "__init__.py"), package_dir)
+        shutil.copy(
+            os.path.join(fakeplugin_src, "providers.yml"),
+            os.path.join(package_dir, providers_conf_dir),
+        )
+
+        # distribution metadata declaring the plugin entry point
+        dist_info_dir = os.path.join(
+            fakeplugin_location.name, "eodag_fakeplugin-0.1.dist-info"
+        )
+        os.makedirs(dist_info_dir)
+        with open(os.path.join(dist_info_dir, "METADATA"), "w") as f:
+            f.write("Metadata-Version: 2.1\nName: eodag-fakeplugin\nVersion: 0.1\n")
+        with open(os.path.join(dist_info_dir, "entry_points.txt"), "w") as f:
+            f.write(
+                "[eodag.plugins.api]\nFakePluginAPI = eodag_fakeplugin:FakePluginAPI\n"
+            )
+
+        # make the distribution discoverable and its package importable
+        sys_path_patcher = mock.patch.object(
+            sys, "path", [fakeplugin_location.name] + sys.path
+        )
+        sys_path_patcher.start()
+        self.addCleanup(sys_path_patcher.stop)
+        sys_modules_patcher = mock.patch.dict(sys.modules)
+        sys_modules_patcher.start()
+        self.addCleanup(sys_modules_patcher.stop)
+        sys.modules.pop("eodag_fakeplugin", None)
+
+        return fakeplugin_location.name
+
     def test_update_providers_from_ext_plugin(self):
         """Load fake external plugin and check if it updates providers config"""
 
         default_providers_count = len(self.dag.providers_config)
 
-        fakeplugin_location = os.path.join(TEST_RESOURCES_PATH, "fake_ext_plugin")
+        fakeplugin_location = self.install_fake_plugin()
 
-        # Create the fake entry point definition
-        ep = pkg_resources.EntryPoint.parse(
-            "FakePluginAPI = eodag_fakeplugin:FakePluginAPI"
-        )
-        # Create a fake distribution to insert into the global working_set
-        d = pkg_resources.Distribution(
-            location=fakeplugin_location,
-            project_name="eodag_fakeplugin",
-            version="0.1",
-        )
-        ep.dist = d
-        # Add the mapping to the fake EntryPoint
-        d._ep_map = {"eodag.plugins.api": {"FakePluginAPI": ep}}
-        # Add the fake distribution to the global working_set
-        pkg_resources.working_set.add(d, fakeplugin_location)
+        # the entry point is found through importlib.metadata, bound to its distribution
+        (ep,) = [
+            ep
+            for ep in entry_points(group="eodag.plugins.api")
+            if ep.name == "FakePluginAPI"
+        ]
+        self.assertEqual(ep.dist.name, "eodag-fakeplugin")
 
         # New EODataAccessGateway instance, check if new conf has been loaded
         self.dag = EODataAccessGateway()
         self.assertEqual(len(self.dag.providers_config), default_providers_count + 1)
+        self.assertIn("fakeplugin_provider", self.dag.providers_config)
+        self.assertTrue(
+            sys.modules["eodag_fakeplugin"].__file__.startswith(fakeplugin_location)
+        )
+
+    def test_update_providers_from_ext_plugin_nested_conf(self):
+        """Nested external plugin providers config must only be found with a recursive glob"""
+
+        default_providers_count = len(self.dag.providers_config)
+
+        # providers config two levels deep in the plugin package
+        self.install_fake_plugin(os.path.join("resources", "conf"))
+        self.addCleanup(_find_plugin_providers_configs.cache_clear)
+
+        # not found with the default globs
+        _find_plugin_providers_configs.cache_clear()
+        self.dag = EODataAccessGateway()
+        self.assertEqual(len(self.dag.providers_config), default_providers_count)
+        self.assertNotIn("fakeplugin_provider", self.dag.providers_config)
+
+        # found with a recursive glob
+        _find_plugin_providers_configs.cache_clear()
+        with temporary_environment(EODAG_PLUGIN_PROVIDERS_GLOB="**/providers.yml"):
+            self.dag = EODataAccessGateway()
+        self.assertEqual(len(self.dag.providers_config), default_providers_count + 1)
+        self.assertIn("fakeplugin_provider", self.dag.providers_config)
@@ -39,6 +39,7 @@ from tests.context import (
     EOProduct,
     HTTPDownload,
     MisconfiguredError,
+    NotAvailableError,
     ProgressCallback,
     config,
 )
@@ -541,6 +542,34 @@ class TestEOProduct(EODagTestCase):
             for needed_log in needed_logs:
                 self.assertIn(needed_log, str(mock_debug.call_args_list))
 
+    def test_eoproduct_assets_get_values(self):
+        """eoproduct.assets.get_values must return assets with href matching filter"""
+        product = self._dummy_product()
+        product.assets.update(
+            {
+                "foo": {"href": "foo.href"},
+                "foo_bar": {"href": "foo_bar.href"},
+                "foo_nohref": {"title": "no href"},
+                "baz": {"href": "baz.href"},
+            }
+        )
+        # no filter
+        self.assertListEqual(
+            [a.key for a in product.assets.get_values()], ["foo", "foo_bar", "baz"]
+        )
+        # regex filter
+        self.assertListEqual(
+            [a.key for a in product.assets.get_values("foo.*")], ["foo", "foo_bar"]
+        )
+        self.assertListEqual(
+            [a.key for a in product.assets.get_values("foo_?bar")], ["foo_bar"]
+        )
+        # literal filter
+        self.assertListEqual([a.key for a in product.assets.get_values("foo")], ["foo"])
+        # not matching or without href
+        self.assertRaises(NotAvailableError, product.assets.get_values, "fo")
+        self.assertRaises(NotAvailableError, product.assets.get_values, "foo_nohref")
+
     def test_eoproduct_repr_html(self):
         """eoproduct html repr must be correctly formatted"""
         product = self._dummy_product()
@@ -555,3 +584,15 @@ class TestEOProduct(EODagTestCase):
         # asset
         asset_repr = html.fromstring(product.assets._repr_html_())
         self.assertIn("Asset", asset_repr.xpath("//thead/tr/td")[0].text)
+
+        # cached asset row must be refreshed when asset is updated
+        self.assertNotIn("foo title", product.assets._repr_html_())
+        product.assets["foo"]["title"] = "foo title"
+        self.assertIn("foo title", product.assets._repr_html_())
+        del product.assets["foo"]["title"]
+        self.assertNotIn("foo title", product.assets._repr_html_())
+
+        # cached asset table must be refreshed when asset is updated
+        self.assertNotIn("foo title", product.assets["foo"]._repr_html_())
+        product.assets["foo"]["title"] = "foo title"
+        self.assertIn("foo title", product.assets["foo"]._repr_html_())
@@ -21,6 +21,7 @@ import importlib
 import json
 import os
 import socket
+import sys
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -50,6 +51,7 @@ from tests.context import (
     STAGING_STATUS,
     TEST_RESOURCES_PATH,
     AuthenticationError,
+    RequestError,
     SearchResult,
     parse_header,
 )
@@ -579,6 +581,29 @@ class RequestTestCase(unittest.TestCase):
 
         self.assertEqual(504, response.status_code)
 
+    @mock.patch("eodag.rest.core.eodag_api.search", autospec=True)
+    def test_request_error_history(self, mock_search: Mock):
+        """RequestError history must be returned with STAC parameters and hidden internal errors"""
+        error = RequestError("search failed")
+        error.history = {
+            ("foo", RequestError("productType is wrong")),
+            ("bar", NotAvailableError("productType not available for bar")),
+        }
+        error.parameters = {"productType"}
+        mock_search.side_effect = error
+
+        response = self.app.get(
+            f"search?collections={self.tested_product_type}", follow_redirects=True
+        )
+        response_content = json.loads(response.content.decode("utf-8"))
+
+        self.assertEqual(500, response.status_code)
+        self.assertIn("an internal error occured", response_content["description"])
+        self.assertIn(
+            "collections not available for bar", response_content["description"]
+        )
+        self.assertNotIn("productType", response_content["description"])
+
     def test_filter(self):
         """latestIntersect filter should only keep the latest products once search area is fully covered"""
         result1 = self._request_valid(
@@ -874,6 +899,27 @@ class RequestTestCase(unittest.TestCase):
             },
         )
 
+    @mock.patch(
+        "eodag.rest.core.eodag_api.search",
+        autospec=True,
+        return_value=SearchResult([], 0),
+    )
+    def test_search_item_id_not_found(self, mock_search: Mock):
+        """Search by id of a missing item should return a 404 HTTP error code"""
+        for url, description in (
+            (
+                f"collections/{self.tested_product_type}/items/foo",
+                f"Item foo in Collection {self.tested_product_type} does not exist.",
+            ),
+            (
+                f"catalogs/{self.tested_product_type}/items/foo",
+                f"Item foo in Catalog {self.tested_product_type} does not exist.",
+            ),
+        ):
+            response = self.app.get(url, follow_redirects=True)
+            self.assertEqual(404, response.status_code)
+            self.assertEqual({"description": description}, response.json())
+
     def test_collection(self):
         """Requesting a collection through eodag server should return a valid response"""
         result = self._request_valid(f"collections/{self.tested_product_type}")
@@ -1331,6 +1377,104 @@ class RequestTestCase(unittest.TestCase):
         """Request to /conformance should return a valid response"""
         self._request_valid("conformance", check_links=False)
 
+    @mock.patch(
+        "eodag.rest.server.get_stac_conformance_json",
+        autospec=True,
+        return_value=b'{"conformsTo":[]}',
+    )
+    def test_response_cache(self, mock_conformance: Mock):
+        """Capability endpoints responses must be cached, and stale ones served on error"""
+        response_cache: Dict[str, Any] = {}
+        self.eodag_http_server.app.state.response_cache = response_cache
+        try:
+            self._request_valid("conformance", check_links=False)
+            self._request_valid("conformance", check_links=False)
+            mock_conformance.assert_called_once()
+
+            # expired response is refreshed, or served if the refresh fails
+            for cache_key, cached_response in response_cache.items():
+                response_cache[cache_key] = (0, *cached_response[1:])
+            mock_conformance.side_effect = RequestError("boom")
+            resp_json = self._request_valid("conformance", check_links=False)
+            self.assertEqual(resp_json, {"conformsTo": []})
+            self.assertEqual(mock_conformance.call_count, 2)
+        finally:
+            del self.eodag_http_server.app.state.response_cache
+
+    def test_response_cache_forwarded_proto(self):
+        """Cached responses links must use the scheme of each request"""
+        self.eodag_http_server.app.state.response_cache = {}
+        try:
+            for headers, expected_href in (
+                ({"X-Forwarded-Proto": "https"}, "https://testserver/"),
+                ({}, "http://testserver/"),
+                ({"X-Forwarded-Proto": "https"}, "https://testserver/"),
+            ):
+                response = self.app.get("/", headers=headers)
+                self.assertEqual(200, response.status_code)
+                self.assertEqual(response.json()["links"][0]["href"], expected_href)
+        finally:
+            del self.eodag_http_server.app.state.response_cache
+
+    def test_response_cache_cors(self):
+        """Cached responses must get the CORS headers of each request origin"""
+        with temporary_environment(
+            EODAG_CORS_ALLOWED_ORIGINS="http://a.example,http://b.example"
+        ):
+            importlib.reload(self.eodag_http_server)
+        try:
+            response_cache: Dict[str, Any] = {}
+            self.eodag_http_server.app.state.response_cache = response_cache
+            app = TestClient(self.eodag_http_server.app)
+            for origin, allowed_origin in (
+                (None, None),
+                ("http://a.example", "http://a.example"),
+                ("http://b.example", "http://b.example"),
+                ("http://c.example", None),
+            ):
+                response = app.get(
+                    "conformance", headers={"Origin": origin} if origin else {}
+                )
+                self.assertEqual(200, response.status_code)
+                self.assertEqual(
+                    allowed_origin, response.headers.get("access-control-allow-origin")
+                )
+            self.assertEqual(1, len(response_cache))
+        finally:
+            importlib.reload(self.eodag_http_server)
+
+    def test_profile_request(self):
+        """Requests must be profiled only with EODAG_PROFILE set and a true profile parameter"""
+        mock_pyinstrument = MagicMock()
+        mock_pyinstrument.Profiler.return_value.output_html.return_value = (
+            "<html>profile</html>"
+        )
+        with temporary_environment(EODAG_PROFILE="1"), mock.patch.dict(
+            sys.modules, {"pyinstrument": mock_pyinstrument}
+        ):
+            importlib.reload(self.eodag_http_server)
+        try:
+            app = TestClient(self.eodag_http_server.app)
+            for profile in (None, "0", "false", "no", ""):
+                response = app.get(
+                    "conformance", params={"profile": profile} if profile else {}
+                )
+                self.assertEqual(200, response.status_code)
+                self.assertEqual("application/json", response.headers["content-type"])
+                self.assertIn("conformsTo", response.json())
+            mock_pyinstrument.Profiler.assert_not_called()
+
+            for profile in ("1", "true", "Yes"):
+                response = app.get("conformance", params={"profile": profile})
+                self.assertEqual(200, response.status_code)
+                self.assertTrue(
+                    response.headers["content-type"].startswith("text/html")
+                )
+                self.assertEqual("<html>profile</html>", response.text)
+            self.assertEqual(3, mock_pyinstrument.Profiler.call_count)
+        finally:
+            importlib.reload(self.eodag_http_server)
+
     def test_service_desc(self):
         """Request to service_desc should return a valid response"""
         service_desc = self._request_valid("api", check_links=False)
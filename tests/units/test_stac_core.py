@@ -161,6 +161,14 @@ class TestStacCore(unittest.TestCase):
         self.assertTrue(self.rest_core.get_detailled_collections_list())
         self.assertTrue(list_pt.called)
 
+    def test_get_stac_extension_oseo_json(self):
+        """get_stac_extension_oseo_json must return the serialized oseo extension of the given URL"""
+        for url in ("http://foo/schema.json", 'http://bar/"schema".json'):
+            self.assertEqual(
+                json.loads(self.rest_core.get_stac_extension_oseo_json(url)),
+                self.rest_core.get_stac_extension_oseo(url),
+            )
+
     def test_get_geometry(self):
         pass  # TODO
 
@@ -24,6 +24,8 @@ from datetime import datetime, timezone
 from tempfile import TemporaryDirectory
 
 from pygeofilter import ast
+from pygeofilter.backends.cql2_json import to_cql2
+from pygeofilter.parsers.cql2_text import parse as parse_cql2_text
 from pygeofilter.values import Geometry
 
 import eodag.rest.utils.rfc3339 as rfc3339
@@ -120,6 +122,19 @@ class TestStacUtils(unittest.TestCase):
         )
         self.assertEqual(json_dict, {"collections": ["S1_SAR_GRD"]})
 
+    def test_cql2_text_to_json(self):
+        """cql2_text_to_json must return the dict of the CQL2-JSON filter"""
+        for cql2_text in (
+            "cloudCover < 10 AND platform IN ('S2A', 'S2B')",
+            "datetime BETWEEN TIMESTAMP('2021-01-01T00:00:00Z') AND TIMESTAMP('2021-02-01T00:00:00Z')",
+            "S_INTERSECTS(geometry, POLYGON((0 0, 1 0, 1 1, 0 0))) AND title LIKE 'S2+A%'",
+            "end_datetime < DATE('2021-02-01')",
+        ):
+            self.assertEqual(
+                self.rest_utils.cql2_text_to_json(cql2_text),
+                json.loads(to_cql2(parse_cql2_text(cql2_text))),
+            )
+
     def test_str2list(self):
         """str2list convert a str variable to a list variable"""
         self.assertIsNone(self.rest_utils.str2list(None))